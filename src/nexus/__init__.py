@@ -7,14 +7,32 @@ Simplified architecture with clear concepts:
 - Clean copy/reference semantics
 """
 
-from .core.case_manager import CaseManager
-from .core.context import NexusContext, PluginContext
-from .core.discovery import get_plugin, list_plugins, plugin
-from .core.engine import PipelineEngine
-from .core.types import PluginConfig
-from .main import create_engine, run_pipeline, run_plugin
+from __future__ import annotations
+
+from .core._lazy import lazy_exports
 
 __version__ = "0.3.0"
+
+# Public names are resolved on first access so that light entry points
+# (``nexus --version``, ``nexus --help``) do not pay for pydantic and the
+# engine stack just by importing the package.
+_LAZY_EXPORTS = {
+    "CaseManager": ".core.case_manager",
+    "NexusContext": ".core.context",
+    "PluginContext": ".core.context",
+    "get_plugin": ".core.discovery",
+    "list_plugins": ".core.discovery",
+    "plugin": ".core.discovery",
+    "PipelineEngine": ".core.engine",
+    "PluginConfig": ".core.types",
+    "create_engine": ".main",
+    "run_pipeline": ".main",
+    "run_plugin": ".main",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
+
+
 __all__ = [
     "NexusContext",
     "PluginContext",
@@ -5,6 +5,7 @@ Provides commands for listing and inspecting cases.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -14,7 +15,8 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.tree import Tree
 
-from .utils import find_project_root, load_case_manager, load_system_configuration
+from ..core.config import load_system_configuration
+from .utils import find_project_root, load_case_manager
 
 console = Console()
 
@@ -115,13 +117,15 @@ def show_case_cmd(ctx, case_name: str):
         if level >= max_level:
             return
         try:
-            items = sorted(path.iterdir(), key=lambda p: (not p.is_file(), p.name))
+            # DirEntry caches the file type, so sorting and branching add no stat calls
+            with os.scandir(path) as entries:
+                items = sorted(entries, key=lambda e: (not e.is_file(), e.name))
             for item in items[:20]:
                 if item.is_file():
                     parent.add(f"[dim]{item.name}[/dim]")
                 elif item.is_dir():
                     branch = parent.add(f"[cyan]{item.name}/[/cyan]")
-                    add_tree_items(branch, item, level + 1, max_level)
+                    add_tree_items(branch, item.path, level + 1, max_level)
         except PermissionError:
             parent.add("[red]<Permission Denied>[/red]")
 
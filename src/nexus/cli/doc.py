@@ -0,0 +1,191 @@
+"""
+Documentation CLI command.
+
+Generates Markdown reference pages for every discovered plugin.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, List, TextIO, Tuple
+
+import click
+
+from ..core.cli_helpers import generate_yaml_value_from_schema
+from ..core.formatter import format_type_name
+from .utils import discover_plugins, find_project_root
+
+# Spaces and path separators in plugin names both become underscores in slugs
+_SAFE_NAME_TABLE = str.maketrans({" ": "_", "/": "_"})
+
+# Static parts of a plugin page; only the plugin name is substituted
+_EXAMPLE_CONFIG_MD = """\
+### Example Configuration
+
+```yaml
+pipeline:
+  - plugin: "{name}"
+    config:
+"""
+
+_FIELD_TABLE_HEADER_MD = """\
+### Field Reference
+
+| Field | Type | Default | Description |
+|-------|------|---------|-------------|
+"""
+
+_CLI_USAGE_MD = """\
+## CLI Usage
+
+```bash
+# Run with default configuration
+nexus plugin "{name}" --case mycase
+
+"""
+
+_CLI_CUSTOM_MD = """\
+# Run with custom configuration
+nexus plugin "{name}" --case mycase \\
+"""
+
+
+@click.command(name="doc")
+@click.option("--output", type=click.Path(), default="docs/api", help="Output directory (default: docs/api)")
+@click.option("--force", "-f", is_flag=True, help="Force overwrite without confirmation")
+def doc_cmd(output: str, force: bool) -> None:
+    from ..core.config import load_system_configuration
+    from ..core.discovery import list_plugins
+
+    project_root = find_project_root(Path.cwd())
+    system_config = load_system_configuration(project_root)
+    discover_plugins(project_root, system_config)
+
+    plugins = list_plugins()
+    if not plugins:
+        click.echo("No plugins to document")
+        return
+
+    output_path = Path(output)
+    plugin_dir = output_path / "plugins"
+
+    if output_path.exists() and not force:
+        click.echo("Output directory exists. Use --force to overwrite.")
+        sys.exit(1)
+
+    plugin_dir.mkdir(parents=True, exist_ok=True)
+
+    # One planning pass: sorted order plus the file slug for every plugin,
+    # shared by the page loop and the index
+    plan = [(name, spec, _safe_plugin_name(name)) for name, spec in sorted(plugins.items())]
+
+    plugin_dir_str = str(plugin_dir)
+    for name, spec, slug in plan:
+        with open(os.path.join(plugin_dir_str, slug + ".md"), "w", encoding="utf-8", newline="\n") as f:
+            _write_plugin_markdown_doc(f, name, spec)
+
+    with open(output_path / "README.md", "w", encoding="utf-8", newline="\n") as f:
+        _write_plugin_index_markdown(f, plan)
+    click.echo(f"Documentation written to {output_path}")
+
+
+# Documentation helpers
+def _write_plugin_markdown_doc(out: TextIO, plugin_name: str, plugin_spec: Any) -> None:
+    from pydantic_core import PydanticUndefined
+
+    w = out.write
+
+    w(f"# {plugin_name}\n\n")
+
+    if plugin_spec.description:
+        w(f"## Overview\n\n{plugin_spec.description.strip()}\n\n")
+
+    w("## Configuration\n\n")
+
+    if plugin_spec.config_model:
+        json_schema = plugin_spec.config_model.model_json_schema()
+        properties = json_schema.get("properties", {})
+
+        w(_EXAMPLE_CONFIG_MD.format(name=plugin_name))
+
+        # Introspect each field once; both sections below iterate this list
+        fields = [
+            (
+                field_name,
+                field_info.default,
+                format_type_name(field_info.annotation),
+                field_info.description or "",
+                properties.get(field_name, {}),
+            )
+            for field_name, field_info in plugin_spec.config_model.model_fields.items()
+        ]
+
+        for field_name, default, field_type, description, field_schema in fields:
+            if default is PydanticUndefined:
+                yaml_lines = generate_yaml_value_from_schema(field_schema, indent=2)
+            elif default is None:
+                yaml_lines = ["null"]
+            elif isinstance(default, str):
+                yaml_lines = [f'"{default}"']
+            elif isinstance(default, bool):
+                yaml_lines = [str(default).lower()]
+            elif isinstance(default, (int, float)):
+                yaml_lines = [str(default)]
+            elif isinstance(default, (list, dict)):
+                yaml_lines = generate_yaml_value_from_schema(field_schema, indent=2)
+            else:
+                yaml_lines = [str(default)]
+
+            comment = f"  # {field_type}: {description}" if description else f"  # {field_type}"
+
+            if len(yaml_lines) == 1 and not yaml_lines[0].startswith("\n"):
+                w(f"      {field_name}: {yaml_lines[0]}{comment}\n")
+            else:
+                w(f"      {field_name}:{comment}\n")
+                for yaml_line in yaml_lines:
+                    if yaml_line:
+                        w(f"    {yaml_line}\n")
+
+        w("```\n\n")
+        w(_FIELD_TABLE_HEADER_MD)
+
+        for field_name, default, field_type, description, _field_schema in fields:
+            if default is PydanticUndefined:
+                default_str = "*required*"
+            elif default is None:
+                default_str = "`null`"
+            elif isinstance(default, str):
+                default_str = f'`"{default}"`'
+            elif isinstance(default, bool):
+                default_str = f"`{str(default).lower()}`"
+            else:
+                default_str = f"`{default}`"
+
+            w(f"| `{field_name}` | `{field_type}` | {default_str} | {description} |\n")
+
+        w("\n")
+    else:
+        w("This plugin has no configuration options.\n\n")
+
+    w(_CLI_USAGE_MD.format(name=plugin_name))
+    if plugin_spec.config_model:
+        w(_CLI_CUSTOM_MD.format(name=plugin_name))
+        example_fields = [field[0] for field in fields[:2]]
+        for i, field in enumerate(example_fields):
+            w(f"  -C {field}=value" + (" \\\n" if i < len(example_fields) - 1 else "\n"))
+    w("```\n")
+
+
+def _safe_plugin_name(name: str) -> str:
+    return name.translate(_SAFE_NAME_TABLE).lower()
+
+
+def _write_plugin_index_markdown(out: TextIO, plan: List[Tuple[str, Any, str]]) -> None:
+    w = out.write
+
+    w(f"# Nexus Plugins\n\nDocumented {len(plan)} plugin(s).\n\n")
+    for name, _spec, slug in plan:
+        w(f"- [{name}](plugins/{slug}.md)\n")
+    w("\nGenerated by `nexus doc`.")
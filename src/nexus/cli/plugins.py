@@ -7,6 +7,7 @@ Provides commands for listing, inspecting, and searching plugins.
 import json
 import sys
 from collections import defaultdict
+from pathlib import Path
 from typing import Any, Dict
 
 import click
@@ -16,7 +17,8 @@ from rich.table import Table
 
 from ..core.discovery import get_plugin, list_plugins
 from ..core.formatter import PluginFormatter, PluginInfo
-from .utils import discover_plugins, find_project_root, load_system_configuration
+from ..core.config import load_system_configuration
+from .utils import discover_plugins, find_project_root
 
 console = Console()
 
@@ -0,0 +1,83 @@
+"""
+Pipeline execution CLI commands.
+
+Provides commands for running a case pipeline or a single plugin.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from .utils import find_project_root, load_case_manager, parse_config_overrides, setup_logging
+
+
+@click.command()
+@click.option("--case", "-c", required=True, help="Case directory (relative or absolute)")
+@click.option("--template", "-t", help="Template to use (optional)")
+@click.option("--config", "-C", multiple=True, help="Config overrides (key=value)")
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def run(case: str, template: Optional[str], config: tuple[str, ...], verbose: bool) -> None:
+    from ..core.config import load_system_configuration
+    from ..core.engine import PipelineEngine
+
+    project_root = find_project_root(Path.cwd())
+    system_overrides, business_overrides = parse_config_overrides(config)
+    system_config = load_system_configuration(project_root, system_overrides)
+    log_level = "DEBUG" if verbose else system_config.get("logging", {}).get("level", "INFO")
+    log_config_path = system_config.get("logging", {}).get("config_path")
+    setup_logging(log_level, project_root, log_config_path)
+
+    manager = load_case_manager(project_root, system_config)
+
+    try:
+        _config_path, case_config = manager.get_case_config(case, template)
+    except Exception as exc:  # pylint: disable=broad-except
+        click.echo(f"ERROR: {exc}", err=True)
+        sys.exit(1)
+
+    engine = PipelineEngine(project_root, manager.resolve_case_path(case), system_config)
+    try:
+        engine.run_pipeline(case_config, business_overrides)
+        click.echo(f"SUCCESS: Pipeline completed for case '{case}'")
+    except Exception as exc:  # pylint: disable=broad-except
+        click.echo(f"ERROR: {exc}", err=True)
+        if verbose:
+            raise
+        sys.exit(1)
+
+
+@click.command(name="exec")
+@click.argument("plugin_name")
+@click.option("--case", "-c", required=True, help="Case directory for execution context")
+@click.option("--config", "-C", multiple=True, help="Config overrides (key=value)")
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def exec_cmd(plugin_name: str, case: str, config: tuple[str, ...], verbose: bool) -> None:
+    """Execute a single plugin."""
+    from ..core.config import load_system_configuration
+    from ..core.engine import PipelineEngine
+
+    project_root = find_project_root(Path.cwd())
+    system_overrides, business_overrides = parse_config_overrides(config)
+    system_config = load_system_configuration(project_root, system_overrides)
+    log_level = "DEBUG" if verbose else system_config.get("logging", {}).get("level", "INFO")
+    log_config_path = system_config.get("logging", {}).get("config_path")
+    setup_logging(log_level, project_root, log_config_path)
+
+    manager = load_case_manager(project_root, system_config)
+    engine = PipelineEngine(project_root, manager.resolve_case_path(case), system_config)
+
+    try:
+        result = engine.run_single_plugin(plugin_name, business_overrides)
+    except Exception as exc:  # pylint: disable=broad-except
+        click.echo(f"ERROR: {exc}", err=True)
+        if verbose:
+            raise
+        sys.exit(1)
+
+    click.echo(f"SUCCESS: Plugin '{plugin_name}' completed")
+    if result is not None:
+        click.echo(f"Result type: {type(result).__name__}")
@@ -13,8 +13,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ..core.discovery import list_plugins
-from .utils import find_project_root, load_case_manager, load_system_configuration
+from ..core.config import load_system_configuration
+from .utils import find_project_root, load_case_manager
 
 console = Console()
 
@@ -134,10 +134,10 @@ def show_template_cmd(ctx, template_name: str):
         if config_data and "pipeline" in config_data:
             console.print("[bold]Plugins Used[/bold]")
             pipeline = config_data["pipeline"]
-            for step in pipeline:
-                if "plugin" in step:
-                    plugin_name = step["plugin"]
-                    console.print(f"  - {plugin_name}")
+            # One print for the whole list instead of one render pass per step
+            plugin_lines = [f"  - {step['plugin']}" for step in pipeline if "plugin" in step]
+            if plugin_lines:
+                console.print("\n".join(plugin_lines))
             console.print()
 
     except Exception as e:  # pylint: disable=broad-except
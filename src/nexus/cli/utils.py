@@ -1,24 +1,41 @@
 from __future__ import annotations
 
-import builtins
+import json
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import click
 
-from ..core.case_manager import CaseManager
-from ..core.config import load_system_configuration
-from ..core.discovery import discover_all_plugins
+from ..core._json import json_loads
+from ..core.config import find_project_root as _find_project_root
 
+if TYPE_CHECKING:
+    from ..core.case_manager import CaseManager
 
+SYSTEM_NAMESPACES = frozenset({"framework", "logging"})
+BUSINESS_NAMESPACES = frozenset({"plugins"})
+_VALID_NAMESPACES_MSG = ", ".join(sorted(SYSTEM_NAMESPACES | BUSINESS_NAMESPACES))
+
+# Classifies a -C override value: JSON literal, boolean, integer, or something
+# float() may accept. Only the last kind is handed to float(), so plain string
+# values never pay for a raised ValueError.
+_VALUE_RE = re.compile(
+    r"(?P<json>[\[{].*)"
+    r"|(?P<bool>true|false)"
+    r"|(?P<int>-?\d+)"
+    r"|(?P<float>\s*[+-]?(?:[\d.].*|inf(?:inity)?|nan)\s*)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@lru_cache(maxsize=32)
 def find_project_root(start_path: Path) -> Path:
-    current = start_path
-    while current != current.parent:
-        if (current / "pyproject.toml").exists():
-            return current
-        current = current.parent
-    return start_path
+    # A CLI process is short-lived and every command starts from the same cwd,
+    # so the walk is memoized here; nexus.main walks afresh on every call
+    return _find_project_root(start_path)
 
 
 def setup_logging(level: str = "INFO", project_root: Optional[Path] = None, config_path: Optional[str] = None) -> None:
@@ -63,67 +80,86 @@ def setup_logging(level: str = "INFO", project_root: Optional[Path] = None, conf
 
 
 def load_case_manager(project_root: Path, system_config: Dict[str, Any]) -> CaseManager:
-    framework_cfg = system_config.get("framework", {})
+    from ..core.case_manager import CaseManager
 
-    cases_roots = framework_cfg.get("cases_roots", ["cases"])
-    cases_roots = [cases_roots] if isinstance(cases_roots, str) else builtins.list(cases_roots)
+    framework_cfg = system_config.get("framework", {})
 
-    templates_roots = framework_cfg.get("templates_roots", ["templates"])
-    templates_roots = [templates_roots] if isinstance(templates_roots, str) else builtins.list(templates_roots)
+    cases_roots = _as_list(framework_cfg.get("cases_roots", ["cases"]))
+    templates_roots = _as_list(framework_cfg.get("templates_roots", ["templates"]))
 
     return CaseManager(project_root, cases_roots=cases_roots, templates_roots=templates_roots)
 
 
+def _as_list(value: Any) -> List[Any]:
+    # CaseManager only reads these, so an existing list is passed through uncopied
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return value
+    return list(value)
+
+
 def discover_plugins(project_root: Path, system_config: Dict[str, Any]) -> None:
+    from ..core.discovery import discover_all_plugins
+
     discover_all_plugins(project_root, system_config)
 
 
 def parse_config_overrides(config_list: tuple[str, ...]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    import json
-
     system: Dict[str, Any] = {}
     business: Dict[str, Any] = {}
-    system_namespaces = {"framework", "logging"}
-    business_namespaces = {"plugins"}
 
     for item in config_list:
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             click.echo(f"Invalid config format: {item}. Use key=value format.")
             continue
 
-        key, value = item.split("=", 1)
-        keys = key.split(".")
-        namespace = keys[0]
+        if "." in key:
+            *parents, leaf = key.split(".")
+            namespace = parents[0]
+        else:
+            # Bare key (e.g. "plugins=..."): no nested dicts to walk
+            parents, leaf, namespace = [], key, key
 
-        if namespace in system_namespaces:
+        if namespace in SYSTEM_NAMESPACES:
             current = system
-        elif namespace in business_namespaces:
+        elif namespace in BUSINESS_NAMESPACES:
             current = business
         else:
             click.echo(
                 f"Warning: Invalid namespace '{namespace}' in {key}. "
-                f"Valid namespaces: {', '.join(sorted(system_namespaces | business_namespaces))}"
+                f"Valid namespaces: {_VALID_NAMESPACES_MSG}"
             )
             continue
 
-        for part in keys[:-1]:
-            current = current.setdefault(part, {})
-
-        lower = value.lower()
-        if value.startswith("{") or value.startswith("["):
+        for part in parents:
+            child = current.get(part)
+            if not isinstance(child, dict):
+                # Later overrides win, even over an earlier scalar at this key
+                child = current[part] = {}
+            current = child
+
+        # One regex match classifies the value instead of a chain of string checks
+        match = _VALUE_RE.fullmatch(value)
+        kind = match.lastgroup if match else None
+        if kind == "json":
             try:
-                current[keys[-1]] = json.loads(value)
+                current[leaf] = json_loads(value)
                 continue
             except json.JSONDecodeError:
                 pass
-        if lower in {"true", "false"}:
-            current[keys[-1]] = lower == "true"
-        elif value.isdigit() or (value.startswith("-") and value[1:].isdigit()):
-            current[keys[-1]] = int(value)
+        if kind == "bool":
+            current[leaf] = value.lower() == "true"
+        elif kind == "int":
+            current[leaf] = int(value)
         else:
-            try:
-                current[keys[-1]] = float(value)
-            except ValueError:
-                current[keys[-1]] = value.strip('"')
+            if kind == "float":
+                try:
+                    current[leaf] = float(value)
+                    continue
+                except ValueError:
+                    pass
+            current[leaf] = value.strip('"')
 
     return system, business
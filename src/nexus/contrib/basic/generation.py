@@ -18,19 +18,37 @@ def build_synthetic_dataframe(
     rng = np.random.default_rng(random_seed)
     categories = [f"Category_{i}" for i in range(num_categories)]
 
-    frame = pd.DataFrame(
-        {
-            "id": np.arange(1, num_rows + 1),
-            "category": rng.choice(categories, num_rows),
-            "value": rng.normal(100, 20, num_rows),
-            "score": rng.random(num_rows),
-            "timestamp": pd.date_range("2024-01-01", periods=num_rows, freq="1h"),
-            "is_active": rng.choice([True, False], num_rows, p=[0.7, 0.3]),
-        }
+    # Draw every column in the original order so a seed keeps producing the
+    # same dataset, and work on raw arrays before wrapping them in a frame.
+    # Categories are sampled as codes, so the frame keeps one label per
+    # category instead of one Python string per row.
+    category = pd.Categorical.from_codes(
+        rng.integers(0, num_categories, num_rows), categories=categories
     )
+    values = rng.normal(100, 20, num_rows)
+    score = rng.random(num_rows)
+    # Same draw as rng.choice([True, False], p=[0.7, 0.3]) without the
+    # generic cdf/searchsorted path
+    is_active = rng.random(num_rows) < 0.7
 
     if noise_level > 0:
-        noise = rng.normal(0, noise_level * frame["value"].std(), num_rows)
-        frame["value"] += noise
+        # Scale standard-normal draws in place rather than allocating a
+        # scaled copy; equivalent to rng.normal(0, sigma, num_rows).
+        noise = rng.standard_normal(num_rows)
+        noise *= noise_level * values.std(ddof=1)
+        values += noise
 
-    return frame
+    return pd.DataFrame(
+        {
+            "id": np.arange(1, num_rows + 1, dtype=np.int32),
+            "category": category,
+            "value": values,
+            "score": score,
+            # Hourly timestamps as plain datetime64 arithmetic (no date_range
+            # frequency machinery involved)
+            "timestamp": np.datetime64("2024-01-01", "ns")
+            + np.arange(num_rows) * np.timedelta64(1, "h"),
+            "is_active": is_active,
+        },
+        copy=False,
+    )
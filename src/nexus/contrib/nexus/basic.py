@@ -5,6 +5,7 @@ Adapts basic data processing logic to Nexus plugin interface.
 """
 
 import logging
+from pathlib import Path
 from typing import Any, Optional
 
 from pydantic import Field
@@ -13,11 +14,31 @@ from nexus.core.context import PluginContext
 from nexus.core.discovery import plugin
 from nexus.core.types import PluginConfig
 
-from nexus.contrib.basic.generation import build_synthetic_dataframe
-
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def _write_frame(frame: Any, output_path: Path) -> None:
+    """
+    Write a DataFrame, choosing the format from the file suffix.
+
+    ``.parquet`` files are written through Arrow as Snappy-compressed,
+    dictionary-encoded Parquet; anything else is written as CSV with pandas.
+    """
+    if output_path.suffix.lower() == ".parquet":
+        import pyarrow as pa
+        from pyarrow import parquet as pq
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        pq.write_table(table, output_path, compression="snappy", use_dictionary=True)
+    else:
+        frame.to_csv(output_path, index=False)
+
+
 # =============================================================================
 # Data Generation Plugins
 # =============================================================================
@@ -50,7 +71,7 @@ class DataGeneratorConfig(PluginConfig):
     )
     output_data: Optional[str] = Field(
         default=None,
-        description="Output CSV file path (None to return DataFrame without saving)"
+        description="Output file path, Parquet for .parquet and CSV otherwise (None to return DataFrame without saving)"
     )
 
 
@@ -70,6 +91,8 @@ def generate_synthetic_data(ctx: PluginContext) -> Any:
     Returns:
         pandas.DataFrame with synthetic data.
     """
+    from nexus.contrib.basic.generation import build_synthetic_dataframe
+
     config: DataGeneratorConfig = ctx.config  # type: ignore
     frame = build_synthetic_dataframe(
         num_rows=config.num_rows,
@@ -81,9 +104,8 @@ def generate_synthetic_data(ctx: PluginContext) -> Any:
     if config.output_data:
         output_path = ctx.resolve_path(config.output_data)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        frame.to_csv(output_path, index=False)
+        _write_frame(frame, output_path)
         logger.info("Wrote dataset to %s", output_path)
 
     ctx.remember("last_result", frame)
     return frame
-
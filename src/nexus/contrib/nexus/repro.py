@@ -14,17 +14,9 @@ from nexus.core.context import PluginContext
 from nexus.core.discovery import plugin
 from nexus.core.types import PluginConfig
 
-from nexus.contrib.repro.video import extract_frames, compose_video, render_all_frames
-from nexus.contrib.repro.common.io import save_jsonl
+# Heavy dependencies (cv2, pandas, tqdm) are imported inside each plugin so
+# that discovery only pays for the plugins that actually run.
 from nexus.contrib.repro.common.time_utils import parse_timestamp
-from nexus.contrib.repro.common.utils import get_video_metadata
-from nexus.contrib.repro.datagen import (
-    generate_timeline_with_jitter,
-    generate_speed_data_event_driven,
-    generate_adb_target_data,
-    save_timeline_csv,
-    SpeedProfile,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -170,6 +162,8 @@ def split_video_to_frames(ctx: PluginContext) -> Any:
         - "input/*.mp4" -> First .mp4 file in input/
         - "input/video_*.mp4" -> First file matching pattern
     """
+    from nexus.contrib.repro.video import extract_frames
+
     config: VideoSplitterConfig = ctx.config  # type: ignore
 
     # Resolve video path with glob pattern support
@@ -214,7 +208,10 @@ def compose_frames_to_video(ctx: PluginContext) -> Any:
 
     Priority: If start_time/end_time are provided, they override start_frame/end_frame.
     """
-    import pandas as pd
+    import numpy as np
+
+    from nexus.contrib.repro.common.io import load_frame_timestamps
+    from nexus.contrib.repro.video import compose_video
 
     config: VideoComposerConfig = ctx.config  # type: ignore
     frames_dir = ctx.resolve_path(config.frames_dir)
@@ -239,7 +236,9 @@ def compose_frames_to_video(ctx: PluginContext) -> Any:
             )
 
         logger.info(f"Loading frame timestamps from {timestamps_path}")
-        frame_times = pd.read_csv(timestamps_path)
+        frame_times = load_frame_timestamps(timestamps_path)
+        frame_indices = frame_times["frame_index"].to_numpy()
+        timestamps_ms = frame_times["timestamp_ms"].to_numpy()
 
         # Parse time values
         start_time_ms = parse_timestamp(config.start_time)
@@ -248,9 +247,9 @@ def compose_frames_to_video(ctx: PluginContext) -> Any:
         # Convert time range to frame indices
         if start_time_ms is not None:
             # Find first frame >= start_time
-            matching_frames = frame_times[frame_times["timestamp_ms"] >= start_time_ms]
-            if len(matching_frames) > 0:
-                start_frame_idx = int(matching_frames.iloc[0]["frame_index"])
+            matching = np.flatnonzero(timestamps_ms >= start_time_ms)
+            if matching.size > 0:
+                start_frame_idx = int(frame_indices[matching[0]])
                 logger.info(
                     f"Start time {start_time_ms} ms -> frame {start_frame_idx}"
                 )
@@ -262,9 +261,9 @@ def compose_frames_to_video(ctx: PluginContext) -> Any:
 
         if end_time_ms is not None:
             # Find last frame <= end_time
-            matching_frames = frame_times[frame_times["timestamp_ms"] <= end_time_ms]
-            if len(matching_frames) > 0:
-                end_frame_idx = int(matching_frames.iloc[-1]["frame_index"])
+            matching = np.flatnonzero(timestamps_ms <= end_time_ms)
+            if matching.size > 0:
+                end_frame_idx = int(frame_indices[matching[-1]])
                 logger.info(
                     f"End time {end_time_ms} ms -> frame {end_frame_idx}"
                 )
@@ -394,6 +393,8 @@ def render_data_on_frames(ctx: PluginContext) -> Any:
             }
         }
     """
+    from nexus.contrib.repro.video import render_all_frames
+
     config: DataRendererConfig = ctx.config  # type: ignore
 
     # Resolve top-level paths
@@ -536,6 +537,9 @@ def generate_timeline(ctx: PluginContext) -> Any:
         1,1759284000034.8
         ...
     """
+    from nexus.contrib.repro.common.utils import get_video_metadata
+    from nexus.contrib.repro.datagen import generate_timeline_with_jitter, save_timeline_csv
+
     config: TimelineGeneratorConfig = ctx.config  # type: ignore
     # Parse start time to timestamp
     start_timestamp_ms = parse_timestamp(config.start_time)
@@ -666,6 +670,10 @@ def generate_speed_data(ctx: PluginContext) -> Any:
         {"timestamp_ms": 1759284002150.5, "speed": 12.3}
         ...
     """
+    from nexus.contrib.repro.common.io import save_jsonl
+    from nexus.contrib.repro.common.utils import get_video_metadata
+    from nexus.contrib.repro.datagen import generate_speed_data_event_driven
+
     config: SpeedDataGeneratorConfig = ctx.config  # type: ignore
     # Get start timestamp from config or context
     if config.start_time:
@@ -818,6 +826,10 @@ def generate_adb_targets(ctx: PluginContext) -> Any:
           ]
         }
     """
+    from nexus.contrib.repro.common.io import save_jsonl
+    from nexus.contrib.repro.common.utils import get_video_metadata
+    from nexus.contrib.repro.datagen import generate_adb_target_data
+
     config: ADBTargetGeneratorConfig = ctx.config  # type: ignore
     # Get start timestamp from config or context
     if config.start_time:
@@ -1035,6 +1047,8 @@ def generate_simple_timeline(ctx: PluginContext) -> Any:
     This plugin is useful for creating a time foundation for data replay
     when no real video is available.
     """
+    from nexus.contrib.repro.datagen import generate_timeline_with_jitter, save_timeline_csv
+
     config: SimpleTimelineGeneratorConfig = ctx.config  # type: ignore
 
     start_timestamp_ms = parse_timestamp(config.start_time)
@@ -1101,11 +1115,12 @@ def generate_blank_frames(ctx: PluginContext) -> Any:
     This plugin reads a timeline CSV and creates a blank image for each
     frame entry, which is useful for replaying data without a real video source.
     """
-    import pandas as pd
     import numpy as np
     import cv2
     from tqdm import tqdm
 
+    from nexus.contrib.repro.common.io import load_frame_timestamps
+
     config: BlankFrameGeneratorConfig = ctx.config  # type: ignore
 
     timestamps_path = ctx.resolve_path(config.timestamps_path)
@@ -1116,7 +1131,7 @@ def generate_blank_frames(ctx: PluginContext) -> Any:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     logger.info(f"Reading timeline from {timestamps_path}")
-    timeline_df = pd.read_csv(timestamps_path)
+    timeline_df = load_frame_timestamps(timestamps_path)
     total_frames = len(timeline_df)
 
     logger.info(
@@ -1127,9 +1142,13 @@ def generate_blank_frames(ctx: PluginContext) -> Any:
     # Create a blank image template
     blank_image = np.full((config.height, config.width, 3), config.color, dtype=np.uint8)
 
+    # Iterate the index column directly instead of boxing a Series per row.
+    # Cast like the old int(row["frame_index"]): the column turns float after
+    # a CSV round trip, and "{:06d}" patterns reject floats.
+    frame_indices = timeline_df["frame_index"].to_numpy().astype("int64")
+
     with tqdm(total=total_frames, desc="Generating blank frames", unit="frame") as pbar:
-        for _, row in timeline_df.iterrows():
-            frame_idx = int(row["frame_index"])
+        for frame_idx in frame_indices.tolist():
             frame_file = output_dir / config.frame_pattern.format(frame_idx)
             cv2.imwrite(str(frame_file), blank_image)
             pbar.update(1)
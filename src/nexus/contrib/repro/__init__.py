@@ -59,47 +59,39 @@ Example (Benchmarking):
 
 from __future__ import annotations
 
-# Core types
-from .types import (
-    DataRenderer,
-    VideoMetadata,
-)
+from nexus.core._lazy import lazy_exports
 
-# I/O utilities
-from .common.io import (
-    load_frame_timestamps,
-    load_jsonl,
-    save_jsonl,
-)
-
-# Video processing
-from .video import extract_frames, compose_video, render_all_frames
-
-# Video utilities
-from .common.utils import get_video_metadata
-
-# Standard video processing
-from .video import (
-    extract_frames,
-    compose_video,
-    render_all_frames,
-)
+# Public names are resolved on first access so that importing a submodule
+# (e.g. ``nexus.contrib.repro.common.time_utils``) does not pull in cv2,
+# pandas and tqdm through this package initializer.
+_LAZY_EXPORTS = {
+    # Core types
+    "DataRenderer": ".types",
+    "VideoMetadata": ".types",
+    # I/O utilities
+    "load_frame_timestamps": ".common.io",
+    "load_jsonl": ".common.io",
+    "save_jsonl": ".common.io",
+    # Video processing
+    "extract_frames": ".video",
+    "compose_video": ".video",
+    "render_all_frames": ".video",
+    # Video utilities
+    "get_video_metadata": ".common.utils",
+    # Data generation utilities
+    "generate_timeline_with_jitter": ".datagen",
+    "generate_speed_data_event_driven": ".datagen",
+    "generate_adb_target_data": ".datagen",
+    "save_timeline_csv": ".datagen",
+    "SpeedProfile": ".datagen",
+    # Renderers
+    "SpeedRenderer": ".renderers",
+    "TargetRenderer": ".renderers",
+    "FrameInfoRenderer": ".renderers",
+}
 
-# Data generation utilities
-from .datagen import (
-    generate_timeline_with_jitter,
-    generate_speed_data_event_driven,
-    generate_adb_target_data,
-    save_timeline_csv,
-    SpeedProfile,
-)
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
 
-# Import renderers
-from .renderers import (
-    SpeedRenderer,
-    TargetRenderer,
-    FrameInfoRenderer,
-)
 
 __all__ = [
     # Types
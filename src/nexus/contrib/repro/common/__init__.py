@@ -4,26 +4,39 @@
 Common utilities for the Repro module, including sensor data management, I/O, and drawing tools.
 """
 
-from .sensor_manager import SensorDataManager, SensorStream
-from .io import load_frame_timestamps, load_jsonl, save_jsonl
-from .utils import get_video_metadata
-from .time_utils import (
-    DEFAULT_TZ,
-    TimeProvider,
-    make_tz,
-    parse_timestamp,
-    format_timestamp,
-    format_duration,
-    format_timecode,
-)
-from .text_renderer import (
-    draw_textbox,
-    TextboxConfig,
-    FontConfig,
-    PanelConfig,
-    PositionConfig,
-    AnchorPoint,
-)
+from __future__ import annotations
+
+from nexus.core._lazy import lazy_exports
+
+# Resolved on first access; see nexus.contrib.repro for the rationale.
+_LAZY_EXPORTS = {
+    # sensor_manager
+    "SensorDataManager": ".sensor_manager",
+    "SensorStream": ".sensor_manager",
+    # io
+    "load_frame_timestamps": ".io",
+    "load_jsonl": ".io",
+    "save_jsonl": ".io",
+    # utils
+    "get_video_metadata": ".utils",
+    # time_utils
+    "DEFAULT_TZ": ".time_utils",
+    "TimeProvider": ".time_utils",
+    "make_tz": ".time_utils",
+    "parse_timestamp": ".time_utils",
+    "format_timestamp": ".time_utils",
+    "format_duration": ".time_utils",
+    "format_timecode": ".time_utils",
+    # text_renderer
+    "draw_textbox": ".text_renderer",
+    "TextboxConfig": ".text_renderer",
+    "FontConfig": ".text_renderer",
+    "PanelConfig": ".text_renderer",
+    "PositionConfig": ".text_renderer",
+    "AnchorPoint": ".text_renderer",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
 
 
 __all__ = [
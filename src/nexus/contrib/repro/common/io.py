@@ -6,10 +6,14 @@ Provides functions for reading/writing JSONL, CSV, and other data formats.
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
 
-import pandas as pd
+from nexus.core._json import json_dumps_line, json_loads
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def load_frame_timestamps(csv_path: Path) -> pd.DataFrame:
@@ -28,7 +32,11 @@ def load_frame_timestamps(csv_path: Path) -> pd.DataFrame:
     Returns:
         DataFrame with columns: frame_index, timestamp_ms
     """
-    df = pd.read_csv(csv_path)
+    from pyarrow import csv as pa_csv
+
+    # Arrow's multithreaded parser builds typed columns directly; converting
+    # the resulting table yields the same int64/float64 frame as pd.read_csv.
+    df = pa_csv.read_csv(csv_path).to_pandas()
     required_cols = {"frame_index", "timestamp_ms"}
     if not required_cols.issubset(df.columns):
         raise ValueError(f"CSV must contain columns: {required_cols}")
@@ -55,8 +63,6 @@ def load_jsonl(jsonl_path: Path) -> List[dict]:
     Raises:
         ValueError: If any record is missing timestamp_ms
     """
-    import json
-
     data = []
     with open(jsonl_path, "r", encoding="utf-8") as f:
         for line_num, line in enumerate(f, 1):
@@ -65,8 +71,8 @@ def load_jsonl(jsonl_path: Path) -> List[dict]:
                 continue
 
             try:
-                record = json.loads(line)
-            except json.JSONDecodeError as e:
+                record = json_loads(line)
+            except json.JSONDecodeError as e:  # orjson's error subclasses it
                 raise ValueError(f"Invalid JSON at line {line_num}: {e}")
 
             if "timestamp_ms" not in record:
@@ -89,11 +95,9 @@ def save_jsonl(data: List[dict], jsonl_path: Path) -> None:
         data: List of dictionaries to save
         jsonl_path: Output path for JSONL file
     """
-    import json
-
     jsonl_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(jsonl_path, "w", encoding="utf-8") as f:
+    with open(jsonl_path, "wb") as f:
         for record in data:
-            json.dump(record, f, ensure_ascii=False)
-            f.write("\n")
+            f.write(json_dumps_line(record))
+            f.write(b"\n")
@@ -1,12 +1,13 @@
 # src/nexus/contrib/repro/common/sensor_manager.py
 
-import json
 import logging
 import heapq
 from bisect import bisect_left, bisect_right
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+from nexus.core._json import json_loads
+
 class SensorStream:
     """
     Manages and provides time-based access to a single stream of sensor data from a JSONL file.
@@ -42,7 +43,7 @@ class SensorStream:
             with open(self.data_path, "r", encoding='utf-8') as f:
                 for line in f:
                     if line.strip():
-                        record = json.loads(line)
+                        record = json_loads(line)
                         if "timestamp_ms" not in record:
                             error_msg = f"Record in {self.data_path} is missing 'timestamp_ms': {record}"
                             self.logger.error(error_msg)
@@ -128,19 +129,19 @@ class SensorStream:
         aligned_time_ms = snapshot_time_ms - self.time_offset_ms
 
         # 3. Find the index of the best match using the chosen strategy
-        self.logger.debug(f"Searching for data at aligned_time_ms={aligned_time_ms} with strategy='{strategy}'")
+        self.logger.debug("Searching for data at aligned_time_ms=%s with strategy='%s'", aligned_time_ms, strategy)
         matched_index = strategy_fn(aligned_time_ms)
 
         if matched_index is None:
-            self.logger.debug(f"No data found for aligned_time_ms={aligned_time_ms} with strategy='{strategy}'")
+            self.logger.debug("No data found for aligned_time_ms=%s with strategy='%s'", aligned_time_ms, strategy)
             return None
 
         # 4. Check if the found data is within the tolerance
         matched_time_ms = self._timestamps[matched_index]
         if abs(matched_time_ms - aligned_time_ms) > self.tolerance_ms:
             self.logger.debug(
-                f"Data at {matched_time_ms} is outside tolerance ({self.tolerance_ms}ms) "
-                f"for aligned_time_ms={aligned_time_ms}"
+                "Data at %s is outside tolerance (%sms) for aligned_time_ms=%s",
+                matched_time_ms, self.tolerance_ms, aligned_time_ms,
             )
             return None
 
@@ -149,7 +150,8 @@ class SensorStream:
         result = matched_data.copy()
         result['snapshot_time_ms'] = snapshot_time_ms
         result['aligned_time_ms'] = aligned_time_ms
-        self.logger.debug(f"Found match at index {matched_index}: {result}")
+        # Lazy %-formatting: the record dict is only rendered when DEBUG is on
+        self.logger.debug("Found match at index %s: %s", matched_index, result)
         return result
 
     def __len__(self):
@@ -197,7 +199,7 @@ class _SensorEventIterator:
                 sensor_name: self._sensors[sensor_name]._data[data_index]
             }
         }
-        self.logger.debug(f"Popped event for '{sensor_name}' at {current_ts}")
+        self.logger.debug("Popped event for '%s' at %s", sensor_name, current_ts)
 
         # Advance the cursor for the stream we just popped from
         self._push_next_for(sensor_name, data_index + 1)
@@ -207,7 +209,7 @@ class _SensorEventIterator:
         while self._heap and self._heap[0][0] == current_ts:
             _, same_ts_sensor_name, same_ts_data_index = heapq.heappop(self._heap)
             
-            self.logger.debug(f"Popped simultaneous event for '{same_ts_sensor_name}' at {current_ts}")
+            self.logger.debug("Popped simultaneous event for '%s' at %s", same_ts_sensor_name, current_ts)
             snapshot['sensors'][same_ts_sensor_name] = self._sensors[same_ts_sensor_name]._data[same_ts_data_index]
             
             # Advance the cursor for this stream as well
@@ -224,9 +226,9 @@ class _SensorEventIterator:
             # Calculate the "world time" of the next event, including the sensor's offset
             timestamp = stream._timestamps[next_index] + stream.time_offset_ms
             heapq.heappush(self._heap, (timestamp, sensor_name, next_index))
-            self.logger.debug(f"Pushed next event for '{sensor_name}' at {timestamp} (index {next_index})")
+            self.logger.debug("Pushed next event for '%s' at %s (index %s)", sensor_name, timestamp, next_index)
         else:
-            self.logger.debug(f"Sensor stream '{sensor_name}' exhausted.")
+            self.logger.debug("Sensor stream '%s' exhausted.", sensor_name)
 
 
 class SensorDataManager:
@@ -317,7 +319,7 @@ class SensorDataManager:
             A dictionary where keys are sensor names and values are the corresponding
             sensor data (including query metadata) at that time.
         """
-        self.logger.debug(f"Getting all sensor values at timestamp_ms: {timestamp_ms}")
+        self.logger.debug("Getting all sensor values at timestamp_ms: %s", timestamp_ms)
         state_snapshot = {}
         for name, sensor_stream in self._sensors.items():
             state_snapshot[name] = sensor_stream.get_value_at(timestamp_ms)
@@ -402,7 +404,7 @@ class SensorPlayback:
             return {}
 
         self.logger.debug(
-            f"Advancing from {self._last_known_time_ms} to {current_time_ms}"
+            "Advancing from %s to %s", self._last_known_time_ms, current_time_ms
         )
         
         new_events_by_sensor: Dict[str, List[Dict[str, Any]]] = {}
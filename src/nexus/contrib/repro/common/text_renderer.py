@@ -99,10 +99,15 @@ def _evaluate_coord(expr: Union[int, str], frame_width: int, frame_height: int)
 
 def _calculate_text_dimensions(
     lines: List[str], font: FontConfig
-) -> Tuple[int, int, int]:
-    """Calculates total width, height, and single line pixel height of the text."""
+) -> Tuple[int, int, int, List[int]]:
+    """
+    Calculates total width, height, and single line pixel height of the text.
+
+    Also returns the glyph height of each line so callers can position the
+    lines without measuring them a second time.
+    """
     if not lines:
-        return 0, 0, 0
+        return 0, 0, 0, []
 
     (w_sample, h_sample), baseline = cv2.getTextSize("Tg", font.face, font.scale, font.thickness)
     
@@ -110,12 +115,14 @@ def _calculate_text_dimensions(
     total_text_h = single_line_ph * len(lines)
 
     max_line_w = 0
+    line_heights: List[int] = []
     for line in lines:
-        (line_w, _), _ = cv2.getTextSize(line, font.face, font.scale, font.thickness)
+        (line_w, line_h), _ = cv2.getTextSize(line, font.face, font.scale, font.thickness)
+        line_heights.append(line_h)
         if line_w > max_line_w:
             max_line_w = line_w
     
-    return max_line_w, total_text_h, single_line_ph
+    return max_line_w, total_text_h, single_line_ph, line_heights
 
 def _calculate_box_top_left(
     target_x: int, target_y: int, anchor: AnchorPoint, box_width: int, box_height: int
@@ -153,7 +160,7 @@ def draw_textbox(
     frame_h, frame_w, _ = frame.shape
     
     # Calculate dimensions of the text block itself
-    text_w, text_h, line_h = _calculate_text_dimensions(lines, config.font)
+    text_w, text_h, line_h, line_heights = _calculate_text_dimensions(lines, config.font)
 
     # Determine the container size (panel or just the text box)
     container_w, container_h = text_w, text_h
@@ -174,9 +181,16 @@ def draw_textbox(
         br_x, br_y = tl_x + container_w, tl_y + container_h
 
         if config.panel.bg_color and config.panel.bg_alpha > 0:
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (tl_x, tl_y), (br_x, br_y), config.panel.bg_color, -1)
-            cv2.addWeighted(overlay, config.panel.bg_alpha, frame, 1 - config.panel.bg_alpha, 0, frame)
+            # Blend only the panel region instead of copying the whole frame
+            x0, y0 = max(tl_x, 0), max(tl_y, 0)
+            x1, y1 = min(br_x + 1, frame_w), min(br_y + 1, frame_h)
+            if x0 < x1 and y0 < y1:
+                roi = frame[y0:y1, x0:x1]
+                overlay = np.empty_like(roi)
+                overlay[:] = config.panel.bg_color
+                frame[y0:y1, x0:x1] = cv2.addWeighted(
+                    overlay, config.panel.bg_alpha, roi, 1 - config.panel.bg_alpha, 0
+                )
         
         if config.panel.border_color and config.panel.border_thickness > 0:
             cv2.rectangle(frame, (tl_x, tl_y), (br_x, br_y), config.panel.border_color, config.panel.border_thickness)
@@ -186,9 +200,7 @@ def draw_textbox(
     text_start_y = tl_y + config.panel.padding if config.panel.enabled else tl_y
 
     # Draw each line of text
-    for i, line in enumerate(lines):
-        (_, line_h_px), baseline = cv2.getTextSize(line, config.font.face, config.font.scale, config.font.thickness)
-        
+    for i, (line, line_h_px) in enumerate(zip(lines, line_heights)):
         # Y-coordinate for the baseline of the current line
         line_baseline_y = text_start_y + (i * line_h) + line_h_px
         
@@ -60,29 +60,20 @@ def generate_timeline_with_jitter(
         >>> # Frame 1: ~1730019000033.333 ms ± 2ms
         >>> # Frame 2: ~1730019000066.667 ms ± 2ms
     """
-    if random_seed is not None:
-        random.seed(random_seed)
-        np.random.seed(random_seed)
+    rng = np.random.default_rng(random_seed)
 
     frame_duration_ms = 1000.0 / fps
-    timeline: List[dict] = []
-
-    for frame_idx in range(total_frames):
-        # Calculate ideal timestamp (float for intermediate calculation)
-        ideal_timestamp = start_timestamp_ms + (frame_idx * frame_duration_ms)
+    frame_indices = np.arange(total_frames)
 
-        # Add random integer jitter: [-jitter_ms, +jitter_ms]
-        jitter = random.randint(-jitter_ms, jitter_ms)
+    # Ideal timestamps plus random integer jitter in [-jitter_ms, +jitter_ms],
+    # drawn for the whole timeline in one call
+    timestamps = start_timestamp_ms + frame_indices * frame_duration_ms
+    timestamps += rng.integers(-jitter_ms, jitter_ms, size=total_frames, endpoint=True)
 
-        # Final timestamp as float
-        actual_timestamp = ideal_timestamp + jitter
-
-        timeline.append({
-            "frame_index": frame_idx,
-            "timestamp_ms": actual_timestamp,
-        })
-
-    return timeline
+    return [
+        {"frame_index": frame_idx, "timestamp_ms": timestamp_ms}
+        for frame_idx, timestamp_ms in enumerate(timestamps.tolist())
+    ]
 
 
 def save_timeline_csv(timeline: List[dict], output_path: Path) -> None:
@@ -155,9 +146,7 @@ def generate_speed_data_event_driven(
         ...     speed_profiles=profiles
         ... )
     """
-    if random_seed is not None:
-        random.seed(random_seed)
-        np.random.seed(random_seed)
+    rng = np.random.default_rng(random_seed)
 
     # Default speed profile: realistic driving scenario
     if speed_profiles is None:
@@ -181,6 +170,12 @@ def generate_speed_data_event_driven(
     profile_idx = 0
     time_in_profile = 0.0
 
+    # Draw the sensor noise for every internal sample up front in one call
+    # (with a small margin for floating point drift in the time accumulator)
+    num_samples = int(np.ceil(duration_s * sampling_rate_hz)) + 2
+    sensor_noise = rng.uniform(-0.5, 0.5, num_samples).tolist()
+    sample_idx = 0
+
     while current_time_s < duration_s:
         # Get current profile
         if profile_idx >= len(speed_profiles):
@@ -193,7 +188,8 @@ def generate_speed_data_event_driven(
         current_speed = profile.start_speed + (profile.end_speed - profile.start_speed) * progress
 
         # Add small random noise to simulate sensor noise
-        current_speed += random.uniform(-0.5, 0.5)
+        current_speed += sensor_noise[sample_idx]
+        sample_idx += 1
         current_speed = max(0, current_speed)  # Speed cannot be negative
 
         # Check if we should record this data point
@@ -551,25 +547,25 @@ def generate_driving_video(
         # Accumulated distance traveled
         distance_traveled = 0.0
 
+        # The static background is identical for every frame, so compose it
+        # once and copy it into a reused frame buffer instead of re-filling
+        background = np.empty((height, width, 3), dtype=np.uint8)
+
+        # Draw sky (gradient), blending every row in one vectorized pass
+        sky_color_top = np.array((180, 120, 60), dtype=np.float64)  # Bluish
+        sky_color_horizon = np.array((200, 160, 100), dtype=np.float64)  # Lighter at horizon
+        alpha = (np.arange(horizon_y) / horizon_y)[:, np.newaxis]
+        sky_rows = sky_color_top * (1 - alpha) + sky_color_horizon * alpha
+        background[:horizon_y, :] = sky_rows.astype(np.uint8)[:, np.newaxis, :]
+
+        # Draw road surface (darker below horizon)
+        background[horizon_y:, :] = (35, 35, 35)
+
+        frame = np.empty_like(background)
+
         with tqdm(total=total_frames, desc="Generating driving video", unit="frame") as pbar:
             for frame_idx in range(total_frames):
-                # Create black frame
-                frame = np.zeros((height, width, 3), dtype=np.uint8)
-
-                # Fill with dark gray road
-                frame[:] = (40, 40, 40)
-
-                # Draw sky (gradient)
-                sky_color_top = (180, 120, 60)  # Bluish
-                sky_color_horizon = (200, 160, 100)  # Lighter at horizon
-                for y in range(horizon_y):
-                    alpha = y / horizon_y
-                    color = tuple(int(sky_color_top[i] * (1 - alpha) +
-                                     sky_color_horizon[i] * alpha) for i in range(3))
-                    frame[y, :] = color
-
-                # Draw road surface (darker below horizon)
-                frame[horizon_y:, :] = (35, 35, 35)
+                np.copyto(frame, background)
 
                 # Draw lane markings
                 _draw_lane_markings(
@@ -7,6 +7,7 @@ Provides functions to split videos into frames and compose frames back into vide
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional, List, Any, Callable, Dict
 
@@ -274,21 +275,35 @@ def render_all_frames(
         renderer_kwargs = renderer_conf.get("kwargs", {})
         renderer_instance = renderer_class(ctx, **renderer_kwargs)
 
+        # Resolve the linked sensor stream once here rather than on every frame
+        sensor_name = renderer_conf.get("sensor")  # Can be None
+        stream = None
+        if sensor_name:
+            stream = sensor_manager.sensors.get(sensor_name)
+            if stream is None:
+                logger.warning(f"Sensor '{sensor_name}' not found in SensorDataManager.")
+
         renderers.append({
-            "instance": renderer_instance,
-            "sensor": renderer_conf.get("sensor"),  # Can be None
+            "render": renderer_instance.render,
+            "sensor": sensor_name,
+            "stream": stream,
             "strategy": renderer_conf.get("match_strategy", "forward"),  # Default to 'forward'
         })
-        logger.info(f"  [{i+1}] {class_path} -> links to sensor '{renderers[-1]['sensor']}'")
+        logger.info(f"  [{i+1}] {class_path} -> links to sensor '{sensor_name}'")
 
     # 3. Load and filter frame timestamps
     logger.info(f"Loading frame timestamps from {timestamps_path}")
     frame_times = load_frame_timestamps(timestamps_path)
 
-    if start_time_ms is not None:
-        frame_times = frame_times[frame_times["timestamp_ms"] >= start_time_ms]
-    if end_time_ms is not None:
-        frame_times = frame_times[frame_times["timestamp_ms"] <= end_time_ms]
+    # Build a single mask so the frame table is sliced at most once
+    if start_time_ms is not None or end_time_ms is not None:
+        ts = frame_times["timestamp_ms"].to_numpy()
+        mask = np.ones(len(ts), dtype=bool)
+        if start_time_ms is not None:
+            mask &= ts >= start_time_ms
+        if end_time_ms is not None:
+            mask &= ts <= end_time_ms
+        frame_times = frame_times[mask]
 
     if len(frame_times) == 0:
         logger.warning("No frames in specified time range")
@@ -303,13 +318,23 @@ def render_all_frames(
     frame_indices = frame_times["frame_index"].values
     timestamps_ms = frame_times["timestamp_ms"].values
 
+    # One directory listing replaces an exists() stat per frame. Names not
+    # found in it (a pattern with a subdirectory, or a case-insensitive
+    # filesystem) are still checked with exists() before being skipped.
+    try:
+        with os.scandir(frames_dir) as entries:
+            existing_frames = {entry.name for entry in entries}
+    except FileNotFoundError:
+        existing_frames = set()
+
     with tqdm(total=total_frames, desc="Rendering frames", unit="frame") as pbar:
         for i in range(total_frames):
             frame_idx = int(frame_indices[i])
             timestamp_ms = float(timestamps_ms[i])
 
-            frame_path = frames_dir / frame_pattern.format(frame_idx)
-            if not frame_path.exists():
+            frame_name = frame_pattern.format(frame_idx)
+            frame_path = frames_dir / frame_name
+            if frame_name not in existing_frames and not frame_path.exists():
                 logger.warning(f"Frame not found: {frame_path}, skipping")
                 continue
 
@@ -322,23 +347,17 @@ def render_all_frames(
 
             # Apply all renderers sequentially using the new data-push model
             for renderer_info in renderers:
-                renderer_instance = renderer_info["instance"]
-                sensor_name = renderer_info["sensor"]
-                strategy = renderer_info["strategy"]
-                
                 data_to_render = None
-                if sensor_name:
-                    # This is a data-driven renderer
-                    if sensor_name in sensor_manager.sensors:
-                        stream = sensor_manager.sensors[sensor_name]
-                        data_to_render = stream.get_value_at(timestamp_ms, strategy=strategy)
-                    else:
-                        logger.warning(f"Sensor '{sensor_name}' not found in SensorDataManager.")
+                if renderer_info["sensor"]:
+                    # This is a data-driven renderer (unknown sensors render with no data)
+                    stream = renderer_info["stream"]
+                    if stream is not None:
+                        data_to_render = stream.get_value_at(timestamp_ms, strategy=renderer_info["strategy"])
                 else:
                     # This is a context-driven renderer like FrameInfoRenderer
                     data_to_render = {'snapshot_time_ms': timestamp_ms}
                 
-                frame = renderer_instance.render(frame, data_to_render)
+                frame = renderer_info["render"](frame, data_to_render)
 
             # Save rendered frame
             output_file = output_path / frame_pattern.format(frame_idx)
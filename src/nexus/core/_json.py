@@ -0,0 +1,70 @@
+"""
+JSON helpers with optional orjson acceleration (``pip install nexus[fast]``).
+
+Parsing gives the same values either way: input orjson would reject or change
+(NaN/Infinity literals, integers beyond 64 bits) is parsed by :mod:`json`.
+Writing only hands plain JSON data to orjson, so both paths accept the same
+records and store the same values; the bytes may still differ in spacing and
+float exponents (``{"a":1e16}`` from orjson, ``{"a": 1e+16}`` from json).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from types import ModuleType
+from typing import Any, Optional
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson turns integers that do not fit in 64 bits into floats when parsing
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+
+
+def json_loads(text: str) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None and not _LONG_DIGITS_RE.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which json accepts
+    return json.loads(text)
+
+
+def json_dumps_line(record: Any) -> bytes:
+    """
+    Serialize one JSONL record as UTF-8 bytes without ASCII escaping.
+
+    Records made only of dicts with str keys, lists, tuples, str, bool, None,
+    64-bit ints and finite floats are written by orjson when it is installed.
+    Anything else (NaN/Infinity, numpy scalars, enums, datetimes, ...) goes
+    through ``json.dumps(record, ensure_ascii=False)``, so such values are
+    neither dropped to ``null`` nor accepted only when orjson is present.
+    The orjson output is compact and writes exponents without ``+``; both
+    forms load back to the same values.
+    """
+    if orjson is not None and _is_plain_json(record):
+        line: bytes = orjson.dumps(record)
+        return line
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
+def _is_plain_json(value: Any) -> bool:
+    # Exact type checks: subclasses (numpy.float64, str enums, ...) are left to json
+    value_type = type(value)
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is int:
+        return bool(-(2**63) <= value < 2**64)
+    if value_type is str or value_type is bool or value is None:
+        return True
+    if value_type is dict:
+        return all(type(k) is str and _is_plain_json(v) for k, v in value.items())
+    if value_type is list or value_type is tuple:
+        return all(_is_plain_json(v) for v in value)
+    return False
@@ -0,0 +1,40 @@
+"""
+Lazy package exports (PEP 562).
+
+Package initializers list their public names and the submodule defining
+each one; the submodule is imported the first time one of its names is used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_exports(
+    namespace: Dict[str, Any], exports: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        namespace: The package's ``globals()``; resolved names are cached here
+        exports: Public name -> submodule path relative to the package
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(globals(), {"CaseManager": ".core.case_manager"})
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(namespace.get("__all__", ())))
+
+    return __getattr__, __dir__
@@ -26,12 +26,39 @@ Typical Usage:
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader is several times faster; PyYAML builds without it fall back
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _iter_template_names(root: Path) -> Iterator[str]:
+    """
+    Yield template names ("basic/etl") for every ``*.yaml`` file under root.
+
+    Walks with os.scandir so file/dir checks come from the directory entries
+    instead of a stat per path, and builds names as strings as it descends.
+    """
+    stack = [(str(root), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):  # like glob("**"), skip linked dirs
+                    stack.append((entry.path, f"{prefix}{name}/"))
+                elif name.endswith(".yaml"):
+                    # Same as Path.with_suffix(""): a bare ".yaml" keeps its name
+                    yield prefix + (name[:-5] or name)
+
 
 class CaseManager:
     """
@@ -439,7 +466,7 @@ class CaseManager:
         """
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=_SafeLoader) or {}
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {file_path}: {e}")
 
@@ -470,13 +497,7 @@ class CaseManager:
                 continue
 
             # Always scan recursively for nested templates
-            yaml_files = search_path.glob("**/*.yaml")
-
-            for yaml_file in yaml_files:
-                # Calculate relative template name
-                rel_path = yaml_file.relative_to(search_path)
-                template_name = str(rel_path.with_suffix("")).replace("\\", "/")
-
+            for template_name in _iter_template_names(search_path):
                 # Add if not already seen (first occurrence wins)
                 if template_name not in seen:
                     templates.append(template_name)
@@ -516,12 +537,17 @@ class CaseManager:
                 logger.debug(f"Cases root does not exist: {cases_root}")
                 continue
 
-            for case_dir in cases_root.iterdir():
-                if case_dir.is_dir() and (case_dir / "case.yaml").exists():
-                    case_name = case_dir.name
-                    if case_name not in seen:
-                        cases.append(case_name)
-                        seen.add(case_name)
+            with os.scandir(cases_root) as entries:
+                case_names = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir() and os.path.exists(os.path.join(entry.path, "case.yaml"))
+                ]
+
+            for case_name in case_names:
+                if case_name not in seen:
+                    cases.append(case_name)
+                    seen.add(case_name)
 
         return sorted(cases)
 
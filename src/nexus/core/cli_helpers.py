@@ -1,9 +1,11 @@
 """
 CLI helper functions for YAML generation.
 
-Extracted from cli.py to be reused by formatter.py.
+Shared by formatter.py (``nexus plugins show``) and the ``nexus doc`` command.
 """
 
+from typing import Iterator
+
 
 def generate_yaml_value_from_schema(schema: dict, indent: int = 0) -> list[str]:
     """
@@ -16,7 +18,29 @@ def generate_yaml_value_from_schema(schema: dict, indent: int = 0) -> list[str]:
     Returns:
         List of YAML lines
     """
-    lines = []
+    return list(iter_yaml_value_from_schema(schema, indent))
+
+
+def _iter_yaml_property(prefix: str, value_lines: Iterator[str]) -> Iterator[str]:
+    # Single-line values go inline after the key, anything else starts a block
+    first = next(value_lines)
+    second = next(value_lines, None)
+    if second is None and not first.startswith("\n"):
+        yield f"{prefix}: {first}"
+        return
+    yield f"{prefix}:{first}"
+    if second is not None:
+        yield second
+        yield from value_lines
+
+
+def iter_yaml_value_from_schema(schema: dict, indent: int = 0) -> Iterator[str]:
+    """
+    Lazily yield the YAML lines for a JSON schema.
+
+    Nested properties are streamed with ``yield from`` rather than copied
+    into a list at every level, so deep schemas stay linear.
+    """
     schema_type = schema.get("type")
 
     # Handle arrays
@@ -26,92 +50,80 @@ def generate_yaml_value_from_schema(schema: dict, indent: int = 0) -> list[str]:
 
         if items_type == "object":
             # Array of objects - show example structure
-            lines.append("")
+            yield ""
             properties = items_schema.get("properties", {})
             if properties:
                 # Has defined properties - show full structure
                 indent_str = "  " * (indent + 1)
-                lines.append(f"{indent_str}- # Example item")
+                yield f"{indent_str}- # Example item"
                 for prop_name, prop_schema in properties.items():
-                    prop_lines = _generate_yaml_value_from_schema(prop_schema, indent + 2)
-                    if len(prop_lines) == 1 and not prop_lines[0].startswith("\n"):
-                        # Simple value
-                        lines.append(f"{indent_str}  {prop_name}: {prop_lines[0]}")
-                    else:
-                        # Complex value
-                        lines.append(f"{indent_str}  {prop_name}:{prop_lines[0]}")
-                        lines.extend(prop_lines[1:])
+                    yield from _iter_yaml_property(
+                        f"{indent_str}  {prop_name}", iter_yaml_value_from_schema(prop_schema, indent + 2)
+                    )
             else:
                 # No properties defined - generic dict
                 # Show a more useful example with common keys
                 indent_str = "  " * (indent + 1)
-                lines.append(f"{indent_str}- # Example item (dict)")
-                lines.append(f"{indent_str}  key1: \"value1\"")
-                lines.append(f"{indent_str}  key2: \"value2\"")
+                yield f"{indent_str}- # Example item (dict)"
+                yield f"{indent_str}  key1: \"value1\""
+                yield f"{indent_str}  key2: \"value2\""
         elif items_type == "string":
             # Array of strings
-            lines.append("")
+            yield ""
             indent_str = "  " * (indent + 1)
-            lines.append(f"{indent_str}- \"item1\"")
-            lines.append(f"{indent_str}- \"item2\"")
+            yield f"{indent_str}- \"item1\""
+            yield f"{indent_str}- \"item2\""
         elif items_type == "number" or items_type == "integer":
             # Array of numbers
-            lines.append("")
+            yield ""
             indent_str = "  " * (indent + 1)
-            lines.append(f"{indent_str}- 1")
-            lines.append(f"{indent_str}- 2")
+            yield f"{indent_str}- 1"
+            yield f"{indent_str}- 2"
         else:
             # Array of primitives or unknown
-            lines.append(" []")
+            yield " []"
 
     # Handle objects
     elif schema_type == "object":
         properties = schema.get("properties", {})
         if properties:
-            lines.append("")
+            yield ""
             indent_str = "  " * (indent + 1)
             for prop_name, prop_schema in properties.items():
-                prop_lines = _generate_yaml_value_from_schema(prop_schema, indent + 1)
-                if len(prop_lines) == 1 and not prop_lines[0].startswith("\n"):
-                    # Simple value
-                    lines.append(f"{indent_str}{prop_name}: {prop_lines[0]}")
-                else:
-                    # Complex value
-                    lines.append(f"{indent_str}{prop_name}:{prop_lines[0]}")
-                    lines.extend(prop_lines[1:])
+                yield from _iter_yaml_property(
+                    f"{indent_str}{prop_name}", iter_yaml_value_from_schema(prop_schema, indent + 1)
+                )
         else:
-            lines.append(" {}")
+            yield " {}"
 
     # Handle primitives
     elif schema_type == "string":
         default = schema.get("default")
         if default:
-            lines.append(f'"{default}"')
+            yield f'"{default}"'
         else:
-            lines.append('"value"')
+            yield '"value"'
 
     elif schema_type == "number" or schema_type == "integer":
         default = schema.get("default")
         if default is not None:
-            lines.append(str(default))
+            yield str(default)
         else:
-            lines.append("0")
+            yield "0"
 
     elif schema_type == "boolean":
         default = schema.get("default")
         if default is not None:
-            lines.append(str(default).lower())
+            yield str(default).lower()
         else:
-            lines.append("false")
+            yield "false"
 
     elif schema_type == "null":
-        lines.append("null")
+        yield "null"
 
     else:
         # Unknown type or anyOf/oneOf
         if "anyOf" in schema or "oneOf" in schema:
-            lines.append('"value"')
+            yield '"value"'
         else:
-            lines.append('""')
-
-    return lines
+            yield '""'
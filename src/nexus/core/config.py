@@ -12,6 +12,7 @@ Typical usage:
 from __future__ import annotations
 
 import logging
+import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
@@ -25,15 +26,37 @@ logger = logging.getLogger(__name__)
 SYSTEM_CONFIG_FILES = ("setting.yaml", "setting-local.yaml")
 SYSTEM_ALLOWED_TOP_LEVEL = {"framework", "logging"}
 
+# libyaml's C loader is several times faster; PyYAML builds without it fall back
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Project root ----------------------------------------------------------------
+
+
+def find_project_root(start_path: Path) -> Path:
+    """Return the nearest directory at or above start_path holding a pyproject.toml."""
+    # Walk on plain strings rather than a chain of Path objects. Not cached:
+    # long-lived processes must see a pyproject.toml created or removed later.
+    start = str(start_path)
+    current = start
+    while True:
+        parent = os.path.dirname(current) or "."
+        if parent == current:
+            return Path(start)
+        if os.path.exists(os.path.join(current, "pyproject.toml")):
+            return Path(current)
+        current = parent
+
 
 # YAML loading ----------------------------------------------------------------
 
 
 @lru_cache(maxsize=128)
-def _load_yaml_cached(file_path_str: str) -> Dict[str, Any]:
+def _load_yaml_cached(file_path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns/size only key the cache so edited files are re-parsed
     try:
         with open(file_path_str, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_SafeLoader) or {}
     except FileNotFoundError:
         return {}
     except yaml.YAMLError as e:
@@ -41,7 +64,12 @@ def _load_yaml_cached(file_path_str: str) -> Dict[str, Any]:
 
 
 def load_yaml(file_path: Path) -> Dict[str, Any]:
-    return _load_yaml_cached(str(file_path))
+    file_path_str = str(file_path)
+    try:
+        stat = os.stat(file_path_str)
+    except FileNotFoundError:
+        return {}
+    return _load_yaml_cached(file_path_str, stat.st_mtime_ns, stat.st_size)
 
 
 # System config ---------------------------------------------------------------
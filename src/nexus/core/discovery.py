@@ -20,6 +20,11 @@ logger = logging.getLogger(__name__)
 
 PLUGIN_REGISTRY: Dict[str, PluginSpec] = {}
 
+# Plugins registered by each discovered package path. Modules are only
+# executed on first import, so later discoveries in the same process (for
+# example one per PipelineEngine) restore the entries from here instead.
+_PACKAGE_PLUGINS: Dict[Path, Dict[str, PluginSpec]] = {}
+
 
 def plugin(*, name: str, config: Optional[type[PluginConfig]] = None, description: Optional[str] = None, tags: Optional[List[str]] = None) -> Callable[[Callable], Callable]:
     """Decorator used by plugin authors to register their callable."""
@@ -137,7 +142,19 @@ def discover_all_plugins(project_root: Path, system_config: Optional[Dict[str, A
         return
 
     for package in packages:
-        discover_from_path(package, project_root)
+        path = resolve_path(package, project_root)
+        cached = _PACKAGE_PLUGINS.get(path)
+        if cached is not None:
+            for name, spec in cached.items():
+                PLUGIN_REGISTRY.setdefault(name, spec)
+            logger.debug("Reusing %s plugins already discovered from %s", len(cached), path)
+            continue
+
+        known = set(PLUGIN_REGISTRY)
+        if discover_from_path(package, project_root):
+            _PACKAGE_PLUGINS[path] = {
+                name: spec for name, spec in PLUGIN_REGISTRY.items() if name not in known
+            }
 
     logger.info("Discovery complete: %s plugins", len(PLUGIN_REGISTRY))
 
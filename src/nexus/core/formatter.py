@@ -7,12 +7,30 @@ Provides unified formatting logic for:
 - JSON/YAML export
 """
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pydantic_core import PydanticUndefined
 
 from .types import PluginSpec
 
 
+def _type_name(annotation: Any) -> str:
+    type_str = getattr(annotation, "__name__", str(annotation))
+    return type_str.replace("typing.", "")
+
+
+# The same few annotations (str, int, Optional[...]) recur across every plugin
+_type_name_cached = lru_cache(maxsize=512)(_type_name)
+
+
+def format_type_name(annotation: Any) -> str:
+    """Format type annotation to readable string."""
+    try:
+        return _type_name_cached(annotation)
+    except TypeError:  # Unhashable annotation (e.g. Annotated metadata)
+        return _type_name(annotation)
+
+
 class PluginInfo:
     """Extracted plugin information for formatting."""
 
@@ -24,7 +42,7 @@ class PluginInfo:
         self.config_model = spec.config_model
         self.fields = self._extract_fields(spec.config_model) if spec.config_model else []
 
-    def _extract_fields(self, config_model) -> List[Dict[str, Any]]:
+    def _extract_fields(self, config_model: Any) -> List[Dict[str, Any]]:
         """Extract field metadata from Pydantic model."""
         fields = []
         json_schema = config_model.model_json_schema()
@@ -47,10 +65,9 @@ class PluginInfo:
         return fields
 
     @staticmethod
-    def _format_type(annotation) -> str:
+    def _format_type(annotation: Any) -> str:
         """Format type annotation to readable string."""
-        type_str = getattr(annotation, "__name__", str(annotation))
-        return type_str.replace("typing.", "")
+        return format_type_name(annotation)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON/YAML export."""
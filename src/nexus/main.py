@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from .core.case_manager import CaseManager
-from .core.config import load_system_configuration
+from .core.config import find_project_root, load_system_configuration
 from .core.engine import PipelineEngine
 
 
@@ -35,7 +35,6 @@ def _build_case_manager(project_root: Path) -> tuple[CaseManager, Dict[str, Any]
     return manager, system_config
 
 
-
 def create_engine(
     case_path: str, project_root: Optional[Path] = None
 ) -> PipelineEngine:
@@ -50,14 +49,7 @@ def create_engine(
         Configured PipelineEngine instance
     """
     if project_root is None:
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / "pyproject.toml").exists():
-                project_root = current
-                break
-            current = current.parent
-        else:
-            project_root = Path.cwd()
+        project_root = find_project_root(Path.cwd())
 
     # Load merged configuration and resolve case path
     case_manager, system_config = _build_case_manager(project_root)
@@ -85,14 +77,7 @@ def run_pipeline(
         Dictionary of all pipeline outputs
     """
     if project_root is None:
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / "pyproject.toml").exists():
-                project_root = current
-                break
-            current = current.parent
-        else:
-            project_root = Path.cwd()
+        project_root = find_project_root(Path.cwd())
 
     # Load merged configuration and access pipeline data
     case_manager, system_config = _build_case_manager(project_root)
@@ -125,14 +110,7 @@ def run_plugin(
         Plugin execution result
     """
     if project_root is None:
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / "pyproject.toml").exists():
-                project_root = current
-                break
-            current = current.parent
-        else:
-            project_root = Path.cwd()
+        project_root = find_project_root(Path.cwd())
 
     # Load merged configuration and resolve case path
     case_manager, system_config = _build_case_manager(project_root)